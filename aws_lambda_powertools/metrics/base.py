@@ -5,7 +5,7 @@ import numbers
 import os
 from collections import defaultdict
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Union
 
 from ..shared import constants
 from ..shared.functions import resolve_env_var_choice
@@ -46,6 +46,10 @@ class MetricUnit(Enum):
     CountPerSecond = "Count/Second"
 
 
+METRIC_UNITS_BY_NAME: Dict[str, MetricUnit] = {unit.name: unit for unit in MetricUnit}  # e.g. "BytesPerSecond"
+METRIC_UNITS_BY_VALUE: Dict[str, MetricUnit] = {unit.value: unit for unit in MetricUnit}  # e.g. "Bytes/Second"
+
+
 class MetricManager:
     """Base class for metric functionality (namespace, metric, dimension, serialization)
 
@@ -86,8 +90,6 @@ class MetricManager:
         self.dimension_set = dimension_set if dimension_set is not None else {}
         self.namespace = resolve_env_var_choice(choice=namespace, env=os.getenv(constants.METRICS_NAMESPACE_ENV))
         self.service = resolve_env_var_choice(choice=service, env=os.getenv(constants.SERVICE_NAME_ENV))
-        self._metric_units = [unit.value for unit in MetricUnit]
-        self._metric_unit_options = list(MetricUnit.__members__)
         self.metadata_set = metadata_set if metadata_set is not None else {}
 
     def add_metric(self, name: str, unit: Union[MetricUnit, str], value: float) -> None:
@@ -136,6 +138,39 @@ class MetricManager:
             # since we could have more than 100 metrics
             self.metric_set.clear()
 
+    def add_metrics(self, metrics: Iterable[Mapping[str, Any]]) -> None:
+        """Adds given metrics in bulk
+
+        Metrics are added in order as per `add_metric`, including flushing
+        all metrics when reaching the maximum of 100 metrics. If a metric is invalid,
+        metrics preceding it remain added.
+
+        Example
+        -------
+        **Add multiple metrics at once**
+
+            metric.add_metrics(
+                [
+                    {"name": "BookingConfirmation", "unit": MetricUnit.Count, "value": 1},
+                    {"name": "BookingLatency", "unit": "Milliseconds", "value": 120},
+                ]
+            )
+
+        Parameters
+        ----------
+        metrics : Iterable[Mapping[str, Any]]
+            Metrics as name, unit and value mappings
+
+        Raises
+        ------
+        MetricUnitError
+            When metric unit is not supported by CloudWatch
+        MetricValueError
+            When metric value isn't a number
+        """
+        for metric in metrics:
+            self.add_metric(**metric)
+
     def serialize_metric_set(
         self, metrics: Optional[Dict] = None, dimensions: Optional[Dict] = None, metadata: Optional[Dict] = None
     ) -> Dict:
@@ -293,14 +328,14 @@ class MetricManager:
         """
 
         if isinstance(unit, str):
-            if unit in self._metric_unit_options:
-                unit = MetricUnit[unit].value
-
-            if unit not in self._metric_units:
+            metric_unit = METRIC_UNITS_BY_NAME.get(unit) or METRIC_UNITS_BY_VALUE.get(unit)
+            if metric_unit is None:
                 raise MetricUnitError(
-                    f"Invalid metric unit '{unit}', expected either option: {self._metric_unit_options}"
+                    f"Invalid metric unit '{unit}', expected either option: {list(METRIC_UNITS_BY_NAME)}"
                 )
 
+            unit = metric_unit
+
         if isinstance(unit, MetricUnit):
             unit = unit.value
 
@@ -1,7 +1,11 @@
+import copy
+import functools
 import json
-import warnings
+import logging
+import os
 from collections import namedtuple
-from typing import Any, Dict, List
+from types import MappingProxyType, SimpleNamespace
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
 import pytest
 
@@ -9,28 +13,61 @@ from aws_lambda_powertools import Metrics, single_metric
 from aws_lambda_powertools.metrics import MetricUnit, MetricUnitError, MetricValueError, SchemaValidationError
 from aws_lambda_powertools.metrics import metrics as metrics_global
 from aws_lambda_powertools.metrics.base import MetricManager
+from aws_lambda_powertools.shared import constants
+
+LambdaContext = namedtuple("LambdaContext", "function_name")
+METRIC_UNIT_NAMES = tuple(unit.name for unit in MetricUnit)
+METRIC_UNIT_VALUES = tuple(unit.value for unit in MetricUnit)
+A_HUNDRED_METRICS = tuple(MappingProxyType({"name": f"metric_{i}", "unit": "Count", "value": 1}) for i in range(100))
 
 
 @pytest.fixture(scope="function", autouse=True)
-def reset_metric_set():
-    metrics = Metrics()
-    metrics.clear_metrics()
-    metrics.clear_default_dimensions()
-    metrics_global.is_cold_start = True  # ensure each test has cold start
-    yield
+def reset_metric_set(monkeypatch):
+    # Metrics instances share class-level state, so give each test its own to avoid leaking it across tests
+    monkeypatch.setattr(Metrics, "_metrics", {})
+    monkeypatch.setattr(Metrics, "_dimensions", {})
+    monkeypatch.setattr(Metrics, "_metadata", {})
+    monkeypatch.setattr(Metrics, "_default_dimensions", {})
+    monkeypatch.setattr(metrics_global, "is_cold_start", True)  # ensure each test has cold start
 
 
 @pytest.fixture
-def metric() -> Dict[str, str]:
-    return {"name": "single_metric", "unit": MetricUnit.Count, "value": 1}
+def captured_emf(monkeypatch) -> List[Dict]:
+    """Record every EMF object as it's serialized so tests can assert on it without parsing stdout"""
+    captured: List[Dict] = []
+
+    def record_dumps(obj, **kwargs):
+        captured.append(obj)
+        return json.dumps(obj, **kwargs)
+
+    # only swap the json reference metrics modules serialize EMF objects with, not the stdlib json module
+    recording_json = SimpleNamespace(dumps=record_dumps)
+    for module in ("base", "metric", "metrics"):
+        monkeypatch.setattr(f"aws_lambda_powertools.metrics.{module}.json", recording_json)
+
+    return captured
 
 
 @pytest.fixture
-def metrics() -> List[Dict[str, str]]:
-    return [
-        {"name": "metric_one", "unit": MetricUnit.Count, "value": 1},
-        {"name": "metric_two", "unit": MetricUnit.Count, "value": 1},
-    ]
+def silent_flush(monkeypatch):
+    """Discard EMF objects the metrics utility flushes to stdout for tests that don't read it"""
+    for module in ("base", "metric", "metrics"):
+        monkeypatch.setattr(
+            f"aws_lambda_powertools.metrics.{module}.print", lambda *args, **kwargs: None, raising=False
+        )
+
+
+@pytest.fixture(scope="module")
+def metric() -> Mapping[str, Any]:
+    return MappingProxyType({"name": "single_metric", "unit": MetricUnit.Count, "value": 1})
+
+
+@pytest.fixture(scope="module")
+def metrics() -> Tuple[Mapping[str, Any], ...]:
+    return (
+        MappingProxyType({"name": "metric_one", "unit": MetricUnit.Count, "value": 1}),
+        MappingProxyType({"name": "metric_two", "unit": MetricUnit.Count, "value": 1}),
+    )
 
 
 @pytest.fixture
@@ -41,17 +78,17 @@ def metrics_same_name() -> List[Dict[str, str]]:
     ]
 
 
-@pytest.fixture
-def dimension() -> Dict[str, str]:
-    return {"name": "test_dimension", "value": "test"}
+@pytest.fixture(scope="module")
+def dimension() -> Mapping[str, str]:
+    return MappingProxyType({"name": "test_dimension", "value": "test"})
 
 
-@pytest.fixture
-def dimensions() -> List[Dict[str, str]]:
-    return [
-        {"name": "test_dimension", "value": "test"},
-        {"name": "test_dimension_2", "value": "test"},
-    ]
+@pytest.fixture(scope="module")
+def dimensions() -> Tuple[Mapping[str, str], ...]:
+    return (
+        MappingProxyType({"name": "test_dimension", "value": "test"}),
+        MappingProxyType({"name": "test_dimension_2", "value": "test"}),
+    )
 
 
 @pytest.fixture
@@ -62,7 +99,7 @@ def non_str_dimensions() -> List[Dict[str, Any]]:
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def namespace() -> str:
     return "test_namespace"
 
@@ -77,9 +114,9 @@ def metadata() -> Dict[str, str]:
     return {"key": "username", "value": "test"}
 
 
-@pytest.fixture
-def a_hundred_metrics() -> List[Dict[str, str]]:
-    return [{"name": f"metric_{i}", "unit": "Count", "value": 1} for i in range(100)]
+@pytest.fixture(scope="module")
+def a_hundred_metrics() -> Tuple[Mapping[str, Any], ...]:
+    return A_HUNDRED_METRICS
 
 
 @pytest.fixture
@@ -87,71 +124,121 @@ def a_hundred_metric_values() -> List[Dict[str, str]]:
     return [{"name": "metric", "unit": "Count", "value": i} for i in range(100)]
 
 
-def serialize_metrics(
-    metrics: List[Dict], dimensions: List[Dict], namespace: str, metadatas: List[Dict] = None
-) -> Dict:
-    """Helper function to build EMF object from a list of metrics, dimensions"""
-    my_metrics = MetricManager(namespace=namespace)
+def freeze(items: Sequence[Mapping]) -> Tuple:
+    """Helper function to turn a list of dicts into a hashable cache key"""
+    return tuple(tuple(item.items()) for item in items)
+
+
+@functools.lru_cache(maxsize=None)
+def _build_emf(
+    metrics: Tuple, dimensions: Tuple, namespace: str, metadatas: Optional[Tuple], service: Optional[str]
+) -> Optional[Dict]:
+    my_metrics = MetricManager(namespace=namespace, service=service)
     for dimension in dimensions:
-        my_metrics.add_dimension(**dimension)
+        my_metrics.add_dimension(**dict(dimension))
 
     for metric in metrics:
-        my_metrics.add_metric(**metric)
+        my_metrics.add_metric(**dict(metric))
 
     if metadatas is not None:
         for metadata in metadatas:
-            my_metrics.add_metadata(**metadata)
+            my_metrics.add_metadata(**dict(metadata))
 
     if len(metrics) != 100:
-        return my_metrics.serialize_metric_set()
+        expected = my_metrics.serialize_metric_set()
+        del expected["_aws"]["Timestamp"]
+        return expected
 
 
-def serialize_single_metric(metric: Dict, dimension: Dict, namespace: str, metadata: Dict = None) -> Dict:
-    """Helper function to build EMF object from a given metric, dimension and namespace"""
-    my_metrics = MetricManager(namespace=namespace)
-    my_metrics.add_metric(**metric)
-    my_metrics.add_dimension(**dimension)
+def serialize_metrics(
+    metrics: Sequence[Mapping], dimensions: Sequence[Mapping], namespace: str, metadatas: Sequence[Mapping] = None
+) -> Dict:
+    """Helper function to build EMF object from a list of metrics, dimensions
+
+    EMF objects are built once per distinct input and returned without Timestamp.
+    Inputs with unhashable values, e.g. dict or list metadata values, can't be cached and are built every time.
+    """
+    arguments = {
+        "metrics": freeze(metrics),
+        "dimensions": freeze(dimensions),
+        "namespace": namespace,
+        "metadatas": freeze(metadatas) if metadatas is not None else None,
+        "service": os.getenv(constants.SERVICE_NAME_ENV),
+    }
 
-    if metadata is not None:
-        my_metrics.add_metadata(**metadata)
+    build_emf = _build_emf
+    try:
+        hash(tuple(arguments.values()))
+    except TypeError:
+        build_emf = _build_emf.__wrapped__
 
-    return my_metrics.serialize_metric_set()
+    return copy.deepcopy(build_emf(**arguments))
 
 
-def remove_timestamp(metrics: List):
-    """Helper function to remove Timestamp key from EMF objects as they're built at serialization"""
-    for metric in metrics:
-        del metric["_aws"]["Timestamp"]
+def serialize_single_metric(metric: Mapping, dimension: Mapping, namespace: str, metadata: Mapping = None) -> Dict:
+    """Helper function to build EMF object from a given metric, dimension and namespace"""
+    return serialize_metrics(
+        metrics=[metric],
+        dimensions=[dimension],
+        namespace=namespace,
+        metadatas=[metadata] if metadata is not None else None,
+    )
 
 
-def capture_metrics_output(capsys):
-    return json.loads(capsys.readouterr().out.strip())
+def assert_emf_equal(expected: Dict, output: Dict):
+    """Helper function to compare EMF objects regardless of the Timestamp set at serialization"""
+    assert "Timestamp" in output["_aws"]
+    assert expected["_aws"]["CloudWatchMetrics"] == output["_aws"]["CloudWatchMetrics"]
+    assert {**expected, "_aws": None} == {**output, "_aws": None}  # dimensions, metadata and metric values
 
 
-def capture_metrics_output_multiple_emf_objects(capsys):
-    return [json.loads(line.strip()) for line in capsys.readouterr().out.split("\n") if line]
+def capture_metrics_output(capfd):
+    return json.loads(capfd.readouterr().out)  # json.loads ignores the trailing newline print adds
 
 
-def test_single_metric_logs_one_metric_only(capsys, metric, dimension, namespace):
-    # GIVEN we try adding more than one metric
-    # WHEN using single_metric context manager
-    with single_metric(namespace=namespace, **metric) as my_metric:
+def capture_metrics_output_multiple_emf_objects(capfd):
+    return [json.loads(line) for line in capfd.readouterr().out.splitlines() if line]
+
+
+@pytest.mark.parametrize(
+    "explicit_namespace,namespace_env_var,service_env_var",
+    [
+        pytest.param(True, False, False, id="explicit_namespace"),
+        pytest.param(False, True, False, id="namespace_env_var"),
+        pytest.param(True, True, False, id="namespace_var_precedence"),
+        pytest.param(True, False, True, id="service_env_var"),
+    ],
+)
+def test_single_metric_logs_one_metric_only(
+    monkeypatch, capfd, explicit_namespace, namespace_env_var, service_env_var, metric, dimension, namespace, service
+):
+    # GIVEN namespace and service are set explicitly and/or via POWERTOOLS_* env vars
+    # where an explicit namespace should take precedence over a different one set via env var
+    if namespace_env_var:
+        monkeypatch.setenv(constants.METRICS_NAMESPACE_ENV, "a_namespace" if explicit_namespace else namespace)
+    if service_env_var:
+        monkeypatch.setenv(constants.SERVICE_NAME_ENV, service)
+    namespace_option = {"namespace": namespace} if explicit_namespace else {}
+
+    # WHEN we try adding more than one metric using single_metric context manager
+    with single_metric(**namespace_option, **metric) as my_metric:
         my_metric.add_metric(name="second_metric", unit="Count", value=1)
         my_metric.add_dimension(**dimension)
 
-    output = capture_metrics_output(capsys)
+    output = capture_metrics_output(capfd)
     expected = serialize_single_metric(metric=metric, dimension=dimension, namespace=namespace)
 
     # THEN we should only have the first metric added
-    remove_timestamp(metrics=[output, expected])
-    assert expected == output
+    # and namespace should favour the explicit choice over POWERTOOLS_METRICS_NAMESPACE
+    # and service dimension should be implicitly added from POWERTOOLS_SERVICE_NAME
+    assert output.get("service") == (service if service_env_var else None)
+    assert_emf_equal(expected, output)
 
 
-def test_log_metrics(capsys, metrics, dimensions, namespace):
+def test_log_metrics(capfd, metrics, dimensions, namespace):
     # GIVEN Metrics is initialized
     my_metrics = Metrics(namespace=namespace)
-    for metric in metrics:
-        my_metrics.add_metric(**metric)
+    my_metrics.add_metrics(metrics)
     for dimension in dimensions:
         my_metrics.add_dimension(**dimension)
 
@@ -162,79 +249,40 @@ def test_log_metrics(capsys, metrics, dimensions, namespace):
         pass
 
     lambda_handler({}, {})
-    output = capture_metrics_output(capsys)
+    output = capture_metrics_output(capfd)
     expected = serialize_metrics(metrics=metrics, dimensions=dimensions, namespace=namespace)
 
     # THEN we should have no exceptions
     # and a valid EMF object should be flushed correctly
-    remove_timestamp(metrics=[output, expected])
-    assert expected == output
-
-
-def test_namespace_env_var(monkeypatch, capsys, metric, dimension, namespace):
-    # GIVEN POWERTOOLS_METRICS_NAMESPACE is set
-    monkeypatch.setenv("POWERTOOLS_METRICS_NAMESPACE", namespace)
-
-    # WHEN creating a metric without explicitly adding a namespace
-    with single_metric(**metric) as my_metric:
-        my_metric.add_dimension(**dimension)
-
-    output = capture_metrics_output(capsys)
-    expected = serialize_single_metric(metric=metric, dimension=dimension, namespace=namespace)
-
-    # THEN we should add a namespace using POWERTOOLS_METRICS_NAMESPACE env var value
-    remove_timestamp(metrics=[output, expected])
-    assert expected == output
-
-
-def test_service_env_var(monkeypatch, capsys, metric, namespace):
-    # GIVEN we use POWERTOOLS_SERVICE_NAME
-    monkeypatch.setenv("POWERTOOLS_SERVICE_NAME", "test_service")
-
-    # WHEN creating a metric without explicitly adding a dimension
-    with single_metric(**metric, namespace=namespace):
-        pass
-
-    output = capture_metrics_output(capsys)
-    expected_dimension = {"name": "service", "value": "test_service"}
-    expected = serialize_single_metric(metric=metric, dimension=expected_dimension, namespace=namespace)
-
-    # THEN a metric should be logged using the implicitly created "service" dimension
-    remove_timestamp(metrics=[output, expected])
-    assert expected == output
+    assert_emf_equal(expected, output)
 
 
-def test_metrics_spillover(monkeypatch, capsys, metric, dimension, namespace, a_hundred_metrics):
+def test_metrics_spillover(capfd, metric, dimension, namespace, a_hundred_metrics):
     # GIVEN Metrics is initialized and we have over a hundred metrics to add
     my_metrics = Metrics(namespace=namespace)
     my_metrics.add_dimension(**dimension)
 
     # WHEN we add more than 100 metrics
-    for _metric in a_hundred_metrics:
-        my_metrics.add_metric(**_metric)
+    # and log_metrics flushes the remaining ones at the end of a function execution
+    @my_metrics.log_metrics
+    def lambda_handler(evt, ctx):
+        my_metrics.add_metrics(a_hundred_metrics)
+        my_metrics.add_metric(**metric)
+
+    lambda_handler({}, {})
+    spillover_output, output = capture_metrics_output_multiple_emf_objects(capfd)
 
     # THEN it should serialize and flush all metrics at the 100th
-    # and clear all metrics and dimensions from memory
-    output = capture_metrics_output(capsys)
-    spillover_metrics = output["_aws"]["CloudWatchMetrics"][0]["Metrics"]
-    assert my_metrics.metric_set == {}
+    spillover_metrics = spillover_output["_aws"]["CloudWatchMetrics"][0]["Metrics"]
     assert len(spillover_metrics) == 100
 
-    # GIVEN we add the 101th metric
-    # WHEN we already had a Metric class instance
-    # with an existing dimension set from the previous 100th metric batch
-    my_metrics.add_metric(**metric)
-
-    # THEN serializing the 101th metric should
-    # create a new EMF object with a single metric in it (101th)
+    # THEN the 101th metric should be flushed in a new EMF object with a single metric in it
     # and contain the same dimension we previously added
-    serialized_101th_metric = my_metrics.serialize_metric_set()
-    expected_101th_metric = serialize_single_metric(metric=metric, dimension=dimension, namespace=namespace)
-    remove_timestamp(metrics=[serialized_101th_metric, expected_101th_metric])
-    assert serialized_101th_metric == expected_101th_metric
+    expected = serialize_single_metric(metric=metric, dimension=dimension, namespace=namespace)
+    assert_emf_equal(expected, output)
 
 
-def test_metric_values_spillover(monkeypatch, capsys, dimension, namespace, a_hundred_metric_values):
+def test_metric_values_spillover(captured_emf, dimension, namespace, a_hundred_metric_values):
     # GIVEN Metrics is initialized and we have over a hundred metric values to add
     my_metrics = Metrics(namespace=namespace)
     my_metrics.add_dimension(**dimension)
@@ -246,7 +294,7 @@ def test_metric_values_spillover(monkeypatch, capsys, dimension, namespace, a_hu
 
     # THEN it should serialize and flush the metric at the 100th value
     # and clear all metrics and dimensions from memory
-    output = capture_metrics_output(capsys)
+    output = captured_emf[-1]
     spillover_values = output[metric["name"]]
     assert my_metrics.metric_set == {}
     assert len(spillover_values) == 100
@@ -261,8 +309,7 @@ def test_metric_values_spillover(monkeypatch, capsys, dimension, namespace, a_hu
     # and contain the same dimension we previously added
     serialized_101st_metric = my_metrics.serialize_metric_set()
     expected_101st_metric = serialize_single_metric(metric=metric, dimension=dimension, namespace=namespace)
-    remove_timestamp(metrics=[serialized_101st_metric, expected_101st_metric])
-    assert serialized_101st_metric == expected_101st_metric
+    assert_emf_equal(expected_101st_metric, serialized_101st_metric)
 
 
 def test_log_metrics_decorator_call_decorated_function(metric, namespace, service):
@@ -279,9 +326,9 @@ def test_log_metrics_decorator_call_decorated_function(metric, namespace, servic
     assert lambda_handler({}, {}) is True
 
 
-def test_schema_validation_incorrect_metric_unit(metric, dimension, namespace):
+def test_schema_validation_incorrect_metric_unit(silent_flush, metric, dimension, namespace):
     # GIVEN we pass a metric unit that is not supported by CloudWatch
-    metric["unit"] = "incorrect_unit"
+    metric = {**metric, "unit": "incorrect_unit"}
 
     # WHEN we try adding a new metric
     # THEN it should fail metric unit validation
@@ -290,7 +337,7 @@ def test_schema_validation_incorrect_metric_unit(metric, dimension, namespace):
             my_metric.add_dimension(**dimension)
 
 
-def test_schema_validation_no_namespace(metric, dimension):
+def test_schema_validation_no_namespace(silent_flush, metric, dimension):
     # GIVEN we don't add any namespace
     # WHEN we attempt to serialize a valid EMF object
     # THEN it should fail namespace validation
@@ -299,9 +346,9 @@ def test_schema_validation_no_namespace(metric, dimension):
             my_metric.add_dimension(**dimension)
 
 
-def test_schema_validation_incorrect_metric_value(metric, dimension, namespace):
+def test_schema_validation_incorrect_metric_value(silent_flush, metric, dimension, namespace):
     # GIVEN we pass an incorrect metric value (non-numeric)
-    metric["value"] = "some_value"
+    metric = {**metric, "value": "some_value"}
 
     # WHEN we attempt to serialize a valid EMF object
     # THEN it should fail validation and raise SchemaValidationError
@@ -319,7 +366,7 @@ def test_schema_no_metrics(service, namespace):
         my_metrics.serialize_metric_set()
 
 
-def test_exceed_number_of_dimensions(metric, namespace):
+def test_exceed_number_of_dimensions(silent_flush, metric, namespace):
     # GIVEN we we have more dimensions than CloudWatch supports
     dimensions = [{"name": f"test_{i}", "value": "test"} for i in range(11)]
 
@@ -331,7 +378,40 @@ def test_exceed_number_of_dimensions(metric, namespace):
                 my_metric.add_dimension(**dimension)
 
 
-def test_log_metrics_during_exception(capsys, metric, dimension, namespace):
+def test_add_metrics_invalid_metric_keeps_preceding_metrics(metrics, namespace):
+    # GIVEN Metrics is initialized
+    my_metrics = Metrics(namespace=namespace)
+    invalid_metric = {"name": "invalid_metric", "unit": "incorrect_unit", "value": 1}
+    remaining_metric = {"name": "metric_three", "unit": MetricUnit.Count, "value": 1}
+
+    # WHEN we add metrics in bulk with an invalid metric in the middle
+    # THEN it should fail metric unit validation
+    with pytest.raises(MetricUnitError):
+        my_metrics.add_metrics([*metrics, invalid_metric, remaining_metric])
+
+    # and metrics preceding the invalid one should have been added
+    assert list(my_metrics.metric_set) == [metric["name"] for metric in metrics]
+
+
+def test_single_metric_add_metrics_keeps_first_metric_only(caplog, capfd, metric, metrics, dimension, namespace):
+    # GIVEN single_metric context manager is used
+    # WHEN we try adding more metrics in bulk
+    with caplog.at_level(logging.DEBUG, logger="aws_lambda_powertools.metrics.metric"):
+        with single_metric(namespace=namespace, **metric) as my_metric:
+            my_metric.add_metrics(metrics)
+            my_metric.add_dimension(**dimension)
+
+    output = capture_metrics_output(capfd)
+    expected = serialize_single_metric(metric=metric, dimension=dimension, namespace=namespace)
+
+    # THEN we should only have the first metric added
+    # and every other metric should be skipped
+    assert_emf_equal(expected, output)
+    for _metric in metrics:
+        assert f"Metric {_metric['name']} already set, skipping..." in caplog.messages
+
+
+def test_log_metrics_during_exception(captured_emf, metric, dimension, namespace):
     # GIVEN Metrics is initialized
     my_metrics = Metrics(namespace=namespace)
     my_metrics.add_dimension(**dimension)
@@ -346,15 +426,14 @@ def test_log_metrics_during_exception(capsys, metric, dimension, namespace):
     with pytest.raises(ValueError):
         lambda_handler({}, {})
 
-    output = capture_metrics_output(capsys)
+    output = captured_emf[-1]
     expected = serialize_single_metric(metric=metric, dimension=dimension, namespace=namespace)
 
     # THEN we should log metrics either way
-    remove_timestamp(metrics=[output, expected])
-    assert expected == output
+    assert_emf_equal(expected, output)
 
 
-def test_log_metrics_raise_on_empty_metrics(capsys, metric, dimension, namespace):
+def test_log_metrics_raise_on_empty_metrics(metric, dimension, namespace):
     # GIVEN Metrics is initialized
     my_metrics = Metrics(service="test_service", namespace=namespace)
 
@@ -369,20 +448,20 @@ def test_log_metrics_raise_on_empty_metrics(capsys, metric, dimension, namespace
         lambda_handler({}, {})
 
 
-def test_all_possible_metric_units(metric, dimension, namespace):
+def test_all_possible_metric_units(silent_flush, metric, dimension, namespace):
+    metric = dict(metric)
+
     # GIVEN we add a metric for each metric unit supported by CloudWatch
     # where metric unit as MetricUnit key e.g. "Seconds", "BytesPerSecond"
-    for unit in MetricUnit:
-        metric["unit"] = unit.name
+    for unit in METRIC_UNIT_NAMES:
+        metric["unit"] = unit
         # WHEN we iterate over all available metric unit keys from MetricUnit enum
         # THEN we raise no MetricUnitError nor SchemaValidationError
         with single_metric(namespace=namespace, **metric) as my_metric:
             my_metric.add_dimension(**dimension)
 
-    # WHEN we iterate over all available metric unit keys from MetricUnit enum
-    all_metric_units = [unit.value for unit in MetricUnit]
-
-    for unit in all_metric_units:
+    # WHEN we iterate over all available metric unit values from MetricUnit enum
+    for unit in METRIC_UNIT_VALUES:
         metric["unit"] = unit  # e.g. "Seconds", "Bytes/Second"
         # THEN we raise no MetricUnitError nor SchemaValidationError
         with single_metric(namespace=namespace, **metric) as my_metric:
@@ -401,7 +480,7 @@ def test_metrics_reuse_metric_set(metric, dimension, namespace):
     assert my_metrics_2.metric_set == my_metrics.metric_set
 
 
-def test_log_metrics_clear_metrics_after_invocation(metric, service, namespace):
+def test_log_metrics_clear_metrics_after_invocation(silent_flush, metric, service, namespace):
     # GIVEN Metrics is initialized
     my_metrics = Metrics(service=service, namespace=namespace)
     my_metrics.add_metric(**metric)
@@ -417,7 +496,7 @@ def test_log_metrics_clear_metrics_after_invocation(metric, service, namespace):
     assert my_metrics.metric_set == {}
 
 
-def test_log_metrics_non_string_dimension_values(capsys, service, metric, non_str_dimensions, namespace):
+def test_log_metrics_non_string_dimension_values(captured_emf, service, metric, non_str_dimensions, namespace):
     # GIVEN Metrics is initialized and dimensions with non-string values are added
     my_metrics = Metrics(service=service, namespace=namespace)
     my_metrics.add_metric(**metric)
@@ -431,7 +510,7 @@ def test_log_metrics_non_string_dimension_values(capsys, service, metric, non_st
         pass
 
     lambda_handler({}, {})
-    output = capture_metrics_output(capsys)
+    output = captured_emf[-1]
 
     # THEN we should have no exceptions
     # and dimension values should be serialized as strings
@@ -439,7 +518,7 @@ def test_log_metrics_non_string_dimension_values(capsys, service, metric, non_st
         assert isinstance(output[dimension["name"]], str)
 
 
-def test_log_metrics_with_explicit_namespace(capsys, metric, service, namespace):
+def test_log_metrics_with_explicit_namespace(captured_emf, metric, service, namespace):
     # GIVEN Metrics is initialized with explicit namespace
     my_metrics = Metrics(service=service, namespace=namespace)
     my_metrics.add_metric(**metric)
@@ -452,14 +531,14 @@ def test_log_metrics_with_explicit_namespace(capsys, metric, service, namespace)
 
     lambda_handler({}, {})
 
-    output = capture_metrics_output(capsys)
+    output = captured_emf[-1]
 
     # THEN we should have no exceptions and the namespace should be set
     # using the service value passed to Metrics constructor
     assert namespace == output["_aws"]["CloudWatchMetrics"][0]["Namespace"]
 
 
-def test_log_metrics_with_implicit_dimensions(capsys, metric, namespace, service):
+def test_log_metrics_with_implicit_dimensions(captured_emf, metric, namespace, service):
     # GIVEN Metrics is initialized with service specified
     my_metrics = Metrics(service=service, namespace=namespace)
     my_metrics.add_metric(**metric)
@@ -471,14 +550,14 @@ def test_log_metrics_with_implicit_dimensions(capsys, metric, namespace, service
 
     lambda_handler({}, {})
 
-    output = capture_metrics_output(capsys)
+    output = captured_emf[-1]
 
     # THEN we should have no exceptions and the dimensions should be set to the name provided in the
     # service passed to Metrics constructor
     assert service == output["service"]
 
 
-def test_log_metrics_with_renamed_service(capsys, metric, service):
+def test_log_metrics_with_renamed_service(captured_emf, metric, service):
     # GIVEN Metrics is initialized with service specified
     my_metrics = Metrics(service=service, namespace="test_application")
     another_service_dimension = {"name": "service", "value": "another_test_service"}
@@ -490,10 +569,8 @@ def test_log_metrics_with_renamed_service(capsys, metric, service):
         my_metrics.add_metric(**metric)
 
     lambda_handler({}, {})
-    output = capture_metrics_output(capsys)
-
     lambda_handler({}, {})
-    second_output = capture_metrics_output(capsys)
+    output, second_output = captured_emf
 
     # THEN we should have no exceptions and the dimensions should be set to the name provided in the
     # add_dimension call
@@ -501,21 +578,7 @@ def test_log_metrics_with_renamed_service(capsys, metric, service):
     assert second_output["service"] == another_service_dimension["value"]
 
 
-def test_namespace_var_precedence(monkeypatch, capsys, metric, dimension, namespace):
-    # GIVEN we use POWERTOOLS_METRICS_NAMESPACE
-    monkeypatch.setenv("POWERTOOLS_METRICS_NAMESPACE", "a_namespace")
-
-    # WHEN creating a metric and explicitly set a namespace
-    with single_metric(namespace=namespace, **metric) as my_metrics:
-        my_metrics.add_dimension(**dimension)
-
-    output = capture_metrics_output(capsys)
-
-    # THEN namespace should match the explicitly passed variable and not the env var
-    assert namespace == output["_aws"]["CloudWatchMetrics"][0]["Namespace"]
-
-
-def test_log_metrics_capture_cold_start_metric(capsys, namespace, service):
+def test_log_metrics_capture_cold_start_metric(captured_emf, namespace, service):
     # GIVEN Metrics is initialized
     my_metrics = Metrics(service=service, namespace=namespace)
 
@@ -524,10 +587,9 @@ def test_log_metrics_capture_cold_start_metric(capsys, namespace, service):
     def lambda_handler(evt, context):
         pass
 
-    LambdaContext = namedtuple("LambdaContext", "function_name")
     lambda_handler({}, LambdaContext("example_fn"))
 
-    output = capture_metrics_output(capsys)
+    output = captured_emf[-1]
 
     # THEN ColdStart metric and function_name and service dimension should be logged
     assert output["ColdStart"] == [1.0]
@@ -535,7 +597,7 @@ def test_log_metrics_capture_cold_start_metric(capsys, namespace, service):
     assert output["service"] == service
 
 
-def test_log_metrics_capture_cold_start_metric_no_service(capsys, namespace):
+def test_log_metrics_capture_cold_start_metric_no_service(captured_emf, namespace):
     # GIVEN Metrics is initialized without service
     my_metrics = Metrics(namespace=namespace)
 
@@ -544,10 +606,9 @@ def test_log_metrics_capture_cold_start_metric_no_service(capsys, namespace):
     def lambda_handler(evt, context):
         pass
 
-    LambdaContext = namedtuple("LambdaContext", "function_name")
     lambda_handler({}, LambdaContext("example_fn"))
 
-    output = capture_metrics_output(capsys)
+    output = captured_emf[-1]
 
     # THEN ColdStart metric and function_name dimension should be logged
     assert output["ColdStart"] == [1.0]
@@ -555,7 +616,7 @@ def test_log_metrics_capture_cold_start_metric_no_service(capsys, namespace):
     assert output.get("service") is None
 
 
-def test_emit_cold_start_metric_only_once(capsys, namespace, service, metric):
+def test_emit_cold_start_metric_only_once(captured_emf, namespace, service, metric):
     # GIVEN Metrics is initialized
     my_metrics = Metrics(service=service, namespace=namespace)
 
@@ -565,14 +626,13 @@ def test_emit_cold_start_metric_only_once(capsys, namespace, service, metric):
     def lambda_handler(evt, context):
         my_metrics.add_metric(**metric)
 
-    LambdaContext = namedtuple("LambdaContext", "function_name")
     lambda_handler({}, LambdaContext("example_fn"))
-    _, _ = capture_metrics_output_multiple_emf_objects(capsys)  # ignore first stdout captured
 
     # THEN ColdStart metric and function_name dimension should be logged once
     lambda_handler({}, LambdaContext("example_fn"))
-    output = capture_metrics_output(capsys)
+    output = captured_emf[-1]
 
+    assert len(captured_emf) == 3
     assert "ColdStart" not in output
     assert "function_name" not in output
 
@@ -587,14 +647,13 @@ def test_log_metrics_decorator_no_metrics_warning(dimensions, namespace, service
         pass
 
     # THEN it should raise a warning instead of throwing an exception
-    with warnings.catch_warnings(record=True) as w:
-        warnings.simplefilter("default")
+    with pytest.warns(UserWarning, match="No metrics to publish, skipping") as w:
         lambda_handler({}, {})
-        assert len(w) == 1
-        assert str(w[-1].message) == "No metrics to publish, skipping"
+
+    assert len(w) == 1
 
 
-def test_log_metrics_with_implicit_dimensions_called_twice(capsys, metric, namespace, service):
+def test_log_metrics_with_implicit_dimensions_called_twice(captured_emf, metric, namespace, service):
     # GIVEN Metrics is initialized with service specified
     my_metrics = Metrics(service=service, namespace=namespace)
 
@@ -606,21 +665,16 @@ def test_log_metrics_with_implicit_dimensions_called_twice(capsys, metric, names
         return True
 
     lambda_handler({}, {})
-    output = capture_metrics_output(capsys)
-
     lambda_handler({}, {})
-    second_output = capture_metrics_output(capsys)
-
-    # THEN we should have no exceptions and the dimensions should be set to the name provided in the
-    # service passed to Metrics constructor
-    assert output["service"] == "test_service"
-    assert second_output["service"] == "test_service"
+    output, second_output = captured_emf
 
-    for metric_record in output["_aws"]["CloudWatchMetrics"]:
-        assert ["service"] in metric_record["Dimensions"]
+    expected_dimension = {"name": "service", "value": service}
+    expected = serialize_single_metric(metric=metric, dimension=expected_dimension, namespace=namespace)
 
-    for metric_record in second_output["_aws"]["CloudWatchMetrics"]:
-        assert ["service"] in metric_record["Dimensions"]
+    # THEN we should have no exceptions and both EMF objects should have the service dimension
+    # set to the name provided in the service passed to Metrics constructor
+    assert_emf_equal(expected, output)
+    assert_emf_equal(expected, second_output)
 
 
 def test_add_metadata_non_string_dimension_keys(service, metric, namespace):
@@ -650,7 +704,7 @@ def test_add_metadata(service, metric, namespace, metadata):
     assert my_metrics.metadata_set == {metadata["key"]: metadata["value"]}
 
 
-def test_log_metrics_with_metadata(capsys, metric, dimension, namespace, service, metadata):
+def test_log_metrics_with_metadata(captured_emf, metric, dimension, namespace, service, metadata):
     # GIVEN Metrics is initialized
     my_metrics = Metrics(namespace=namespace)
     my_metrics.add_metric(**metric)
@@ -664,12 +718,32 @@ def test_log_metrics_with_metadata(capsys, metric, dimension, namespace, service
 
     lambda_handler({}, {})
 
-    output = capture_metrics_output(capsys)
+    output = captured_emf[-1]
     expected = serialize_single_metric(metric=metric, dimension=dimension, namespace=namespace, metadata=metadata)
 
     # THEN we should have no exceptions and metadata
-    remove_timestamp(metrics=[output, expected])
-    assert expected == output
+    assert_emf_equal(expected, output)
+
+
+def test_log_metrics_with_non_scalar_metadata(captured_emf, metric, dimension, namespace):
+    # GIVEN Metrics is initialized
+    my_metrics = Metrics(namespace=namespace)
+    my_metrics.add_metric(**metric)
+    my_metrics.add_dimension(**dimension)
+    metadata = {"key": "booking", "value": {"id": "booking_id", "items": ["item_one", "item_two"]}}
+
+    # WHEN we utilize log_metrics to serialize and add metadata with a dict value
+    @my_metrics.log_metrics
+    def lambda_handler(evt, ctx):
+        my_metrics.add_metadata(**metadata)
+
+    lambda_handler({}, {})
+
+    output = captured_emf[-1]
+    expected = serialize_single_metric(metric=metric, dimension=dimension, namespace=namespace, metadata=metadata)
+
+    # THEN we should have no exceptions and metadata should be kept as is
+    assert_emf_equal(expected, output)
 
 
 def test_serialize_metric_set_metric_definition(metric, dimension, namespace, service, metadata):
@@ -700,12 +774,10 @@ def test_serialize_metric_set_metric_definition(metric, dimension, namespace, se
     metric_definition_output = my_metrics.serialize_metric_set()
 
     # THEN we should emit a valid embedded metric definition object
-    assert "Timestamp" in metric_definition_output["_aws"]
-    remove_timestamp(metrics=[metric_definition_output, expected_metric_definition])
-    assert metric_definition_output == expected_metric_definition
+    assert_emf_equal(expected_metric_definition, metric_definition_output)
 
 
-def test_log_metrics_capture_cold_start_metric_separately(capsys, namespace, service, metric, dimension):
+def test_log_metrics_capture_cold_start_metric_separately(captured_emf, namespace, service, metric, dimension):
     # GIVEN Metrics is initialized
     my_metrics = Metrics(service=service, namespace=namespace)
 
@@ -715,10 +787,9 @@ def test_log_metrics_capture_cold_start_metric_separately(capsys, namespace, ser
         my_metrics.add_metric(**metric)
         my_metrics.add_dimension(**dimension)
 
-    LambdaContext = namedtuple("LambdaContext", "function_name")
     lambda_handler({}, LambdaContext("example_fn"))
 
-    cold_start_blob, custom_metrics_blob = capture_metrics_output_multiple_emf_objects(capsys)
+    cold_start_blob, custom_metrics_blob = captured_emf
 
     # THEN ColdStart metric and function_name dimension should be logged
     # in a separate EMF blob than the application metrics
@@ -740,7 +811,7 @@ def test_log_metrics_capture_cold_start_metric_separately(capsys, namespace, ser
     assert custom_metrics_blob["test_dimension"] == dimension["value"]
 
 
-def test_log_multiple_metrics(capsys, metrics_same_name, dimensions, namespace):
+def test_log_multiple_metrics(captured_emf, metrics_same_name, dimensions, namespace):
     # GIVEN Metrics is initialized
     my_metrics = Metrics(namespace=namespace)
 
@@ -751,17 +822,15 @@ def test_log_multiple_metrics(capsys, metrics_same_name, dimensions, namespace):
     # and flush multiple metrics with the same name at the end of a function execution
     @my_metrics.log_metrics
     def lambda_handler(evt, ctx):
-        for metric in metrics_same_name:
-            my_metrics.add_metric(**metric)
+        my_metrics.add_metrics(metrics_same_name)
 
     lambda_handler({}, {})
-    output = capture_metrics_output(capsys)
+    output = captured_emf[-1]
     expected = serialize_metrics(metrics=metrics_same_name, dimensions=dimensions, namespace=namespace)
 
     # THEN we should have no exceptions
     # and a valid EMF object should be flushed correctly
-    remove_timestamp(metrics=[output, expected])
-    assert expected == output
+    assert_emf_equal(expected, output)
 
 
 def test_serialize_metric_set_metric_definition_multiple_values(
@@ -786,8 +855,7 @@ def test_serialize_metric_set_metric_definition_multiple_values(
 
     # GIVEN Metrics is initialized and multiple metrics are added with the same name
     my_metrics = Metrics(service=service, namespace=namespace)
-    for metric in metrics_same_name:
-        my_metrics.add_metric(**metric)
+    my_metrics.add_metrics(metrics_same_name)
     my_metrics.add_dimension(**dimension)
     my_metrics.add_metadata(**metadata)
 
@@ -795,9 +863,7 @@ def test_serialize_metric_set_metric_definition_multiple_values(
     metric_definition_output = my_metrics.serialize_metric_set()
 
     # THEN we should emit a valid embedded metric definition object
-    assert "Timestamp" in metric_definition_output["_aws"]
-    remove_timestamp(metrics=[metric_definition_output, expected_metric_definition])
-    assert metric_definition_output == expected_metric_definition
+    assert_emf_equal(expected_metric_definition, metric_definition_output)
 
 
 def test_metric_manage_metadata_set():
@@ -810,7 +876,7 @@ def test_metric_manage_metadata_set():
         pytest.fail("AttributeError should not be raised")
 
 
-def test_log_persist_default_dimensions(capsys, metrics, dimensions, namespace):
+def test_log_persist_default_dimensions(captured_emf, metrics, dimensions, namespace):
     # GIVEN Metrics is initialized and we persist a set of default dimensions
     my_metrics = Metrics(namespace=namespace)
     my_metrics.set_default_dimensions(environment="test", log_group="/lambda/test")
@@ -820,14 +886,13 @@ def test_log_persist_default_dimensions(capsys, metrics, dimensions, namespace):
     # at the end of a function execution
     @my_metrics.log_metrics
     def lambda_handler(evt, ctx):
-        for metric in metrics:
-            my_metrics.add_metric(**metric)
+        my_metrics.add_metrics(metrics)
 
     lambda_handler({}, {})
-    first_invocation = capture_metrics_output(capsys)
+    first_invocation = captured_emf[-1]
 
     lambda_handler({}, {})
-    second_invocation = capture_metrics_output(capsys)
+    second_invocation = captured_emf[-1]
 
     # THEN we should have default dimensions in both outputs
     assert "environment" in first_invocation
@@ -858,7 +923,7 @@ def test_default_dimensions_across_instances(namespace):
     assert "environment" in same_metrics.default_dimensions
 
 
-def test_log_metrics_with_default_dimensions(capsys, metrics, dimensions, namespace):
+def test_log_metrics_with_default_dimensions(captured_emf, metrics, dimensions, namespace):
     # GIVEN Metrics is initialized
     my_metrics = Metrics(namespace=namespace)
     default_dimensions = {"environment": "test", "log_group": "/lambda/test"}
@@ -868,14 +933,13 @@ def test_log_metrics_with_default_dimensions(capsys, metrics, dimensions, namesp
     # at the end of a function execution
     @my_metrics.log_metrics(default_dimensions=default_dimensions)
     def lambda_handler(evt, ctx):
-        for metric in metrics:
-            my_metrics.add_metric(**metric)
+        my_metrics.add_metrics(metrics)
 
     lambda_handler({}, {})
-    first_invocation = capture_metrics_output(capsys)
+    first_invocation = captured_emf[-1]
 
     lambda_handler({}, {})
-    second_invocation = capture_metrics_output(capsys)
+    second_invocation = captured_emf[-1]
 
     # THEN we should have default dimensions in both outputs
     assert "environment" in first_invocation